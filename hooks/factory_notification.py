@@ -2,75 +2,205 @@
 # /// script
 # requires-python = ">=3.11"
 # dependencies = [
+#     "miniaudio",
+#     "openai",
+#     "orjson",
+#     "pyahocorasick",
 #     "python-dotenv",
 # ]
 # ///
 
-import argparse
+import contextlib
 import json
 import os
 import sys
-import subprocess
-import random
+import time
+import types
 from pathlib import Path
 
+from utils.common import (
+    build_message_pool,
+    get_tts_fallbacks,
+    get_tts_script_path,
+    is_voice_enabled,
+    json_loads,
+    load_env_cached,
+    pick_message,
+    speak_with_openai,
+)
+
 try:
-    from dotenv import load_dotenv
-    # Load .env from project root (parent of hooks directory)
-    project_root = Path(__file__).parent.parent
-    env_file = project_root / ".env"
-    load_dotenv(env_file)
+    import ahocorasick
 except ImportError:
-    pass  # dotenv is optional
+    ahocorasick = None  # pyahocorasick is optional, fall back to substring scans
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # No file locking (e.g. Windows), announcements are not coalesced
+
+# Queue shared by hook processes to coalesce announcements
+TTS_QUEUE_PATH = Path.home() / '.claude' / 'state' / 'tts_queue.json'
+
+# Announcements arriving within this window (seconds) are coalesced into one
+COALESCE_WINDOW = 0.2
+# Total time (seconds) the TTS fallback chain may spend on one message
+TTS_TIMEOUT = 15
+# Time (seconds) a drainer may keep starting queued announcements, so it stays
+# well inside Claude Code's 60 s hook timeout
+TTS_DRAIN_BUDGET = 20
+# A drainer that hasn't checked in for this long (seconds) is assumed dead.
+# It checks in before every announcement. Each one is held to TTS_TIMEOUT including
+# playback, except that a single stalled network read may overrun it by another TTS_TIMEOUT.
+TTS_QUEUE_STALE_AFTER = 3 * TTS_TIMEOUT
+
+
+# More specific phase detection patterns to prevent false positives.
+# Immutable so the automaton built from them at import can't drift out of sync.
+PHASE_PATTERNS = types.MappingProxyType({
+    1: ("🏁 phase 1", "system verification", "voice greeting", "welcome message"),
+    2: ("🤔 phase 2", "question engine", "project discovery", "interactive interview"),
+    3: ("🧠 phase 3", "context assembly", "automated research", "tech stack analysis"),
+    4: ("📝 phase 4", "generate project files", "claude.md", "prd.md", "tasks.md"),
+    5: ("🎉 phase 5", "voice celebration", "project completion", "final success"),
+})
+
+# Keywords that mark a todo as factory-related
+FACTORY_KEYWORDS = (
+    'phase 1', 'phase 2', 'phase 3', 'phase 4', 'phase 5',
+    'context engineering factory', 'project discovery', 'automated research',
+    'generate project files', 'voice celebration', '🏁', '🤔', '🧠', '📝', '🎉',
+)
 
 
-def get_tts_script_path():
+# Special completion messages for the final phase
+COMPLETION_MESSAGES = (
+    "EchoContext Factory operation complete! Your project is ready for acceleration!",
+    "Quantum context assembly successful! Speed enhances understanding - ready to build!",
+    "Factory mission accomplished! Your AI amplifier is now supercharged!",
+    "Context engineering complete! Time to transform ideas into reality!",
+    "Factory optimization finished! Your consciousness catalyst awaits deployment!",
+)
+
+# Personal messages are str.format templates so only the chosen one is interpolated
+PERSONAL_COMPLETION_TEMPLATES = (
+    "Amazing work, {engineer_name}! Your EchoContext Factory has created the perfect setup!",
+    "Brilliant, {engineer_name}! Your project context is now optimized for maximum acceleration!",
+    "Outstanding, {engineer_name}! The factory has generated a comprehensive development blueprint!",
+    "Exceptional results, {engineer_name}! Your AI collaborator is now fully contextualized!",
+    "Perfect execution, {engineer_name}! Your Scientific Mediator approach has created excellence!",
+)
+
+# Phase-specific messages
+PHASE_GENERIC_MESSAGES = {
+    1: (
+        "EchoContext Factory activated - preparing quantum setup",
+        "Factory systems online - initializing consciousness bridge",
+        "Welcome to acceleration mode - factory components verified",
+        "Quantum context assembly initiated - all systems operational",
+    ),
+    2: (
+        "Interview engine online - ready for intelligence gathering",
+        "Question framework activated - preparing comprehensive analysis",
+        "Project discovery mode engaged - optimizing context collection",
+        "Smart interview system ready - initiating knowledge extraction",
+    ),
+    3: (
+        "Tech stack analysis in progress - optimizing architecture",
+        "Context assembly engaged - building comprehensive framework",
+        "Pattern matching active - identifying optimal solutions",
+        "Technology optimization running - crafting perfect setup",
+    ),
+    4: (
+        "File generation commencing - creating comprehensive context",
+        "Template processing active - building project foundation",
+        "Document assembly in progress - generating development blueprint",
+        "Context materialization engaged - creating your project framework",
+    ),
+    5: (
+        "Final optimizations in progress - preparing project completion",
+        "Quality assurance active - verifying context completeness",
+        "Project finalization engaged - ensuring excellence standards",
+        "Completion protocols running - validating factory output",
+    ),
+}
+
+PHASE_PERSONAL_TEMPLATES = {
+    1: (
+        "Hey {engineer_name}, EchoContext Factory is spinning up for maximum speed!",
+        "{engineer_name}, your consciousness catalyst is activating - let's accelerate!",
+        "Speed mode engaged, {engineer_name} - factory ready for your brilliance!",
+        "{engineer_name}, your AI amplifier is online and ready to optimize!",
+    ),
+    2: (
+        "{engineer_name}, interview mode activated - time to gather your project vision!",
+        "Ready for your input, {engineer_name} - let's build the perfect context!",
+        "{engineer_name}, question engine online - your Scientific Mediator skills needed!",
+        "Speed up the discovery, {engineer_name} - factory is ready for your requirements!",
+    ),
+    3: (
+        "{engineer_name}, tech stack optimization in progress - creating your ideal setup!",
+        "Analyzing patterns for you, {engineer_name} - building the perfect architecture!",
+        "{engineer_name}, context assembly engaged - your vision is taking shape!",
+        "Speed optimization active, {engineer_name} - crafting your development blueprint!",
+    ),
+    4: (
+        "{engineer_name}, file generation in progress - your comprehensive context is materializing!",
+        "Creating your project foundation, {engineer_name} - documents are being optimized!",
+        "{engineer_name}, context assembly nearly complete - your blueprint is taking form!",
+        "Almost there, {engineer_name} - generating your perfect development framework!",
+    ),
+    5: (
+        "{engineer_name}, final touches in progress - your project setup is almost perfect!",
+        "Quality checks running, {engineer_name} - ensuring your context meets excellence standards!",
+        "{engineer_name}, completion protocols active - your factory output is being validated!",
+        "Almost finished, {engineer_name} - your AI collaborator is being finalized!",
+    ),
+}
+
+COMPLETION_MESSAGE_POOL = build_message_pool(PERSONAL_COMPLETION_TEMPLATES, COMPLETION_MESSAGES)
+PHASE_MESSAGE_POOLS = {
+    phase: build_message_pool(PHASE_PERSONAL_TEMPLATES[phase], generic_messages)
+    for phase, generic_messages in PHASE_GENERIC_MESSAGES.items()
+}
+
+
+def build_factory_automaton():
     """
-    Determine which TTS script to use based on available API keys.
-    Priority order: ElevenLabs > OpenAI > pyttsx3
+    Build one Aho-Corasick automaton over factory keywords and phase patterns, or None if unavailable.
+    Each word maps to (is_factory_keyword, phase) so a single pass answers both questions.
     """
-    # Get current script directory and construct utils/tts path
-    script_dir = Path(__file__).parent
-    tts_dir = script_dir / "utils" / "tts"
-    
-    # Check for ElevenLabs API key (highest priority)
-    if os.getenv('ELEVENLABS_API_KEY'):
-        elevenlabs_script = tts_dir / "elevenlabs_tts.py"
-        if elevenlabs_script.exists():
-            return str(elevenlabs_script)
-    
-    # Check for OpenAI API key (second priority)
-    if os.getenv('OPENAI_API_KEY'):
-        openai_script = tts_dir / "openai_tts.py"
-        if openai_script.exists():
-            return str(openai_script)
+    if ahocorasick is None:
+        return None
     
-    # Fall back to pyttsx3 (no API key required)
-    pyttsx3_script = tts_dir / "pyttsx3_tts.py"
-    if pyttsx3_script.exists():
-        return str(pyttsx3_script)
+    entries = {keyword: (True, None) for keyword in FACTORY_KEYWORDS}
+    for phase, patterns in PHASE_PATTERNS.items():
+        for pattern in patterns:
+            entries[pattern] = (pattern in entries, phase)
     
-    return None
+    automaton = ahocorasick.Automaton()
+    for word, value in entries.items():
+        automaton.add_word(word, value)
+    automaton.make_automaton()
+    return automaton
+
 
+FACTORY_AUTOMATON = build_factory_automaton()
 
-def detect_factory_phase(todo_content):
-    """Detect which factory phase is being executed based on todo content."""
-    if not todo_content:
+
+def detect_factory_phase(content_lower):
+    """
+    Detect which factory phase is being executed based on todo content.
+    Expects content that has already been lowercased by the caller.
+    """
+    if not content_lower:
         return None
     
-    # More specific phase detection patterns to prevent false positives
-    phase_patterns = {
-        1: ["🏁 phase 1", "system verification", "voice greeting", "welcome message"],
-        2: ["🤔 phase 2", "question engine", "project discovery", "interactive interview"],
-        3: ["🧠 phase 3", "context assembly", "automated research", "tech stack analysis"],
-        4: ["📝 phase 4", "generate project files", "claude.md", "prd.md", "tasks.md"],
-        5: ["🎉 phase 5", "voice celebration", "project completion", "final success"]
-    }
-    
-    content_lower = todo_content.lower()
+    if FACTORY_AUTOMATON is not None:
+        return scan_factory_content(content_lower)[1]
     
     # Check for specific phase patterns, prioritizing exact matches
-    for phase, patterns in phase_patterns.items():
+    for phase, patterns in PHASE_PATTERNS.items():
         for pattern in patterns:
             if pattern in content_lower:
                 return phase
@@ -78,115 +208,37 @@ def detect_factory_phase(todo_content):
     return None
 
 
+def scan_factory_content(content_lower):
+    """
+    Scan lowercased todo content for factory keywords and phase patterns in one pass.
+    Returns (is_factory_todo, phase), where phase is the lowest matching phase or None.
+    """
+    if FACTORY_AUTOMATON is None:
+        is_factory_todo = any(keyword in content_lower for keyword in FACTORY_KEYWORDS)
+        return is_factory_todo, detect_factory_phase(content_lower)
+    
+    is_factory_todo = False
+    phase = None
+    for _, (is_keyword, word_phase) in FACTORY_AUTOMATON.iter(content_lower):
+        is_factory_todo = is_factory_todo or is_keyword
+        # The lowest phase wins, matching the phase-order priority of the substring scan
+        if word_phase is not None and (phase is None or word_phase < phase):
+            phase = word_phase
+        if is_factory_todo and phase == 1:
+            break  # Nothing later in the content can change the result
+    
+    return is_factory_todo, phase
+
+
 def get_factory_message(phase, engineer_name=None, is_completed=False):
     """Get appropriate factory message based on phase and completion status."""
-    
     if is_completed and phase == 5:
-        # Special completion messages
-        completion_messages = [
-            "EchoContext Factory operation complete! Your project is ready for acceleration!",
-            "Quantum context assembly successful! Speed enhances understanding - ready to build!",
-            "Factory mission accomplished! Your AI amplifier is now supercharged!",
-            "Context engineering complete! Time to transform ideas into reality!",
-            "Factory optimization finished! Your consciousness catalyst awaits deployment!"
-        ]
-        
-        personal_completion_messages = [
-            f"Amazing work, {engineer_name}! Your EchoContext Factory has created the perfect setup!",
-            f"Brilliant, {engineer_name}! Your project context is now optimized for maximum acceleration!",
-            f"Outstanding, {engineer_name}! The factory has generated a comprehensive development blueprint!",
-            f"Exceptional results, {engineer_name}! Your AI collaborator is now fully contextualized!",
-            f"Perfect execution, {engineer_name}! Your Scientific Mediator approach has created excellence!"
-        ]
-        
-        if engineer_name and random.random() < 0.7:
-            return random.choice(personal_completion_messages)
-        else:
-            return random.choice(completion_messages)
-    
-    # Phase-specific messages
-    phase_messages = {
-        1: {
-            "generic": [
-                "EchoContext Factory activated - preparing quantum setup",
-                "Factory systems online - initializing consciousness bridge",
-                "Welcome to acceleration mode - factory components verified",
-                "Quantum context assembly initiated - all systems operational"
-            ],
-            "personal": [
-                f"Hey {engineer_name}, EchoContext Factory is spinning up for maximum speed!",
-                f"{engineer_name}, your consciousness catalyst is activating - let's accelerate!",
-                f"Speed mode engaged, {engineer_name} - factory ready for your brilliance!",
-                f"{engineer_name}, your AI amplifier is online and ready to optimize!"
-            ]
-        },
-        2: {
-            "generic": [
-                "Interview engine online - ready for intelligence gathering",
-                "Question framework activated - preparing comprehensive analysis",
-                "Project discovery mode engaged - optimizing context collection",
-                "Smart interview system ready - initiating knowledge extraction"
-            ],
-            "personal": [
-                f"{engineer_name}, interview mode activated - time to gather your project vision!",
-                f"Ready for your input, {engineer_name} - let's build the perfect context!",
-                f"{engineer_name}, question engine online - your Scientific Mediator skills needed!",
-                f"Speed up the discovery, {engineer_name} - factory is ready for your requirements!"
-            ]
-        },
-        3: {
-            "generic": [
-                "Tech stack analysis in progress - optimizing architecture",
-                "Context assembly engaged - building comprehensive framework",
-                "Pattern matching active - identifying optimal solutions",
-                "Technology optimization running - crafting perfect setup"
-            ],
-            "personal": [
-                f"{engineer_name}, tech stack optimization in progress - creating your ideal setup!",
-                f"Analyzing patterns for you, {engineer_name} - building the perfect architecture!",
-                f"{engineer_name}, context assembly engaged - your vision is taking shape!",
-                f"Speed optimization active, {engineer_name} - crafting your development blueprint!"
-            ]
-        },
-        4: {
-            "generic": [
-                "File generation commencing - creating comprehensive context",
-                "Template processing active - building project foundation",
-                "Document assembly in progress - generating development blueprint",
-                "Context materialization engaged - creating your project framework"
-            ],
-            "personal": [
-                f"{engineer_name}, file generation in progress - your comprehensive context is materializing!",
-                f"Creating your project foundation, {engineer_name} - documents are being optimized!",
-                f"{engineer_name}, context assembly nearly complete - your blueprint is taking form!",
-                f"Almost there, {engineer_name} - generating your perfect development framework!"
-            ]
-        },
-        5: {
-            "generic": [
-                "Final optimizations in progress - preparing project completion",
-                "Quality assurance active - verifying context completeness",
-                "Project finalization engaged - ensuring excellence standards",
-                "Completion protocols running - validating factory output"
-            ],
-            "personal": [
-                f"{engineer_name}, final touches in progress - your project setup is almost perfect!",
-                f"Quality checks running, {engineer_name} - ensuring your context meets excellence standards!",
-                f"{engineer_name}, completion protocols active - your factory output is being validated!",
-                f"Almost finished, {engineer_name} - your AI collaborator is being finalized!"
-            ]
-        }
-    }
+        return pick_message(COMPLETION_MESSAGE_POOL, COMPLETION_MESSAGES, engineer_name)
     
-    if phase not in phase_messages:
+    if phase not in PHASE_MESSAGE_POOLS:
         return None
     
-    messages = phase_messages[phase]
-    
-    if engineer_name and random.random() < 0.7:
-        return random.choice(messages["personal"])
-    else:
-        return random.choice(messages["generic"])
+    return pick_message(PHASE_MESSAGE_POOLS[phase], PHASE_GENERIC_MESSAGES[phase], engineer_name)
 
 
 def should_announce_factory_progress(input_data):
@@ -204,22 +256,15 @@ def should_announce_factory_progress(input_data):
     if not todos:
         return False, None, None
     
-    # Look for factory-related todos with more specific patterns
-    factory_keywords = [
-        'phase 1', 'phase 2', 'phase 3', 'phase 4', 'phase 5',
-        'context engineering factory', 'project discovery', 'automated research',
-        'generate project files', 'voice celebration', '🏁', '🤔', '🧠', '📝', '🎉'
-    ]
-    
     for todo in todos:
-        content = todo.get('content', '').lower()
+        # Lowercase once per todo; the scan below works on this copy only
+        content_lower = todo.get('content', '').lower()
         status = todo.get('status', '')
         
         # Check if this is a factory todo with specific patterns
-        is_factory_todo = any(keyword in content for keyword in factory_keywords)
+        is_factory_todo, phase = scan_factory_content(content_lower)
         
         if is_factory_todo:
-            phase = detect_factory_phase(content)
             if phase:
                 # Check if todo was just completed
                 is_completed = status == 'completed'
@@ -233,19 +278,125 @@ def should_announce_factory_progress(input_data):
     return False, None, None
 
 
-def is_voice_enabled():
-    """Check if voice announcements are enabled in factory configuration."""
-    try:
-        config_path = os.path.join(os.path.expanduser('~'), '.claude', 'config', 'factory.json')
-        if not os.path.exists(config_path):
-            return True  # Default to enabled if no config
+def speak_with_fallbacks(message):
+    """Speak the message with the first TTS engine in the fallback chain that succeeds."""
+    import subprocess
+    
+    fallback_scripts = get_tts_fallbacks()
+    
+    # One deadline shared by the whole chain, so failures don't stack timeouts
+    deadline = time.monotonic() + TTS_TIMEOUT
+    
+    # Try each script until one succeeds
+    for script_path in fallback_scripts:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break  # Out of time - give up rather than start another engine
         
-        with open(config_path, 'r') as f:
-            config = json.load(f)
+        # Prefer in-process OpenAI TTS; run the script via uv only if it can't be imported
+        if script_path.endswith("openai_tts.py"):
+            spoken = speak_with_openai(message, timeout=remaining)
+            if spoken:
+                break  # Success - exit loop
+            if spoken is not None:
+                continue  # In-process TTS failed, try next one
         
-        return config.get('voice', {}).get('factoryNotifications', True)
-    except Exception:
-        return True  # Default to enabled on any error
+        try:
+            subprocess.run([
+                "uv", "run", script_path, message
+            ], 
+            timeout=remaining,
+            check=True  # Raise exception if script fails
+            )
+            break  # Success - exit loop
+        except (subprocess.TimeoutExpired, subprocess.SubprocessError, subprocess.CalledProcessError):
+            # This script failed, try next one
+            continue
+
+
+@contextlib.contextmanager
+def locked_tts_queue():
+    """Yield the shared TTS queue state under an exclusive file lock, saving it on exit."""
+    TTS_QUEUE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    
+    with open(TTS_QUEUE_PATH, 'a+') as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            f.seek(0)
+            try:
+                state = json.loads(f.read() or '{}')
+            except json.JSONDecodeError:
+                state = {}  # Corrupt queue, start fresh
+            if not isinstance(state, dict):
+                state = {}  # Valid JSON but not a queue, start fresh
+            # Drop anything a hand-edited or foreign file put in the wrong shape
+            pending = state.get('pending')
+            if not isinstance(pending, list):
+                pending = []
+            state['pending'] = [entry for entry in pending if isinstance(entry, dict)]
+            if not isinstance(state.get('drainer'), (int, float)):
+                state['drainer'] = None
+            
+            yield state
+            
+            f.seek(0)
+            f.truncate()
+            json.dump(state, f)
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def announcement_key(entry):
+    """Announcements for the same session and phase supersede each other."""
+    return entry.get('session'), entry.get('phase')
+
+
+def enqueue_announcement(message, phase, session_id):
+    """
+    Add an announcement to the shared TTS queue, replacing any older one for the same
+    session and phase.
+    Returns True if this process should drain the queue, False if another process already is.
+    """
+    now = time.time()
+    entry = {'session': session_id, 'phase': phase, 'ts': now, 'message': message}
+    key = announcement_key(entry)
+    with locked_tts_queue() as state:
+        pending = [queued for queued in state['pending'] if announcement_key(queued) != key]
+        pending.append(entry)
+        state['pending'] = pending
+        
+        drainer = state['drainer']
+        if drainer and now - drainer < TTS_QUEUE_STALE_AFTER:
+            # The live drainer picks this up after its current announcement
+            return False
+        
+        state['drainer'] = now
+        return True
+
+
+def take_next_announcement():
+    """
+    Pop the pending announcement with the lowest phase and return its message,
+    or None when the queue is empty.
+    """
+    with locked_tts_queue() as state:
+        pending = state['pending']
+        if not pending:
+            state['drainer'] = None  # Release the drainer role once empty
+            return None
+        
+        # Earlier phases first, and among equal phases the oldest first
+        entry = min(pending, key=lambda queued: (queued.get('phase') or 0, queued.get('ts', 0)))
+        pending.remove(entry)
+        state['drainer'] = time.time()  # Refresh the drainer's heartbeat
+    
+    return entry['message']
+
+
+def release_tts_queue():
+    """Give up the drainer role; anything still pending is spoken by the next drainer."""
+    with locked_tts_queue() as state:
+        state['drainer'] = None
 
 
 def announce_factory_progress():
@@ -256,7 +407,7 @@ def announce_factory_progress():
             return  # Voice announcements disabled
         
         # Read JSON input from stdin
-        input_data = json.loads(sys.stdin.read())
+        input_data = json_loads(sys.stdin.buffer.read())
         
         # Check if this should trigger factory announcement
         should_announce, phase, is_completed = should_announce_factory_progress(input_data)
@@ -264,6 +415,9 @@ def announce_factory_progress():
         if not should_announce or not phase:
             return  # Not a factory operation
         
+        # Deferred until an announcement is needed so the no-op path skips dotenv
+        load_env_cached()
+        
         tts_script = get_tts_script_path()
         if not tts_script:
             return  # No TTS scripts available
@@ -277,46 +431,42 @@ def announce_factory_progress():
         if not message:
             return  # No message for this phase
         
-        # Try TTS with fallback logic
-        script_dir = Path(__file__).parent
-        tts_dir = script_dir / "utils" / "tts"
-        
-        # Define fallback order: Always try ElevenLabs -> OpenAI -> pyttsx3
-        # Let individual scripts handle missing API keys
-        fallback_scripts = []
-        
-        # Always try ElevenLabs first (script will handle missing API key)
-        elevenlabs_script = tts_dir / "elevenlabs_tts.py"
-        if elevenlabs_script.exists():
-            fallback_scripts.append(str(elevenlabs_script))
+        # Without file locking there is no shared queue, so announce directly
+        if fcntl is None:
+            speak_with_fallbacks(message)
+            return
         
-        # Always try OpenAI second (script will handle missing API key)
-        openai_script = tts_dir / "openai_tts.py"
-        if openai_script.exists():
-            fallback_scripts.append(str(openai_script))
+        try:
+            should_drain = enqueue_announcement(message, phase, input_data.get('session_id', ''))
+        except OSError:
+            # The queue file can't be used, so announce directly as without file locking
+            speak_with_fallbacks(message)
+            return
         
-        # Always add pyttsx3 as final fallback (no API key needed)
-        pyttsx3_script = tts_dir / "pyttsx3_tts.py"
-        if pyttsx3_script.exists():
-            fallback_scripts.append(str(pyttsx3_script))
+        # Another hook process is already draining the queue and will pick this up
+        if not should_drain:
+            return
         
-        # Try each script until one succeeds
-        for script_path in fallback_scripts:
-            try:
-                subprocess.run([
-                    "uv", "run", script_path, message
-                ], 
-                timeout=15,
-                check=True  # Raise exception if script fails
-                )
-                break  # Success - exit loop
-            except (subprocess.TimeoutExpired, subprocess.SubprocessError, subprocess.CalledProcessError):
-                # This script failed, try next one
-                continue
+        # Drain for a bounded time only: this hook blocks its own Claude session meanwhile
+        drain_deadline = time.monotonic() + TTS_DRAIN_BUDGET
+        holding_queue = True
+        try:
+            # Give rapid-fire TodoWrite updates a moment to land, then drain the queue
+            time.sleep(COALESCE_WINDOW)
+            while time.monotonic() < drain_deadline:
+                message = take_next_announcement()
+                if message is None:
+                    holding_queue = False  # Queue empty, the drainer role was released with it
+                    break
+                try:
+                    speak_with_fallbacks(message)
+                except Exception:
+                    # Keep draining so the queue is released even if TTS fails
+                    continue
+        finally:
+            if holding_queue:
+                release_tts_queue()
         
-    except (subprocess.TimeoutExpired, subprocess.SubprocessError, FileNotFoundError):
-        # Fail silently if TTS encounters issues
-        pass
     except json.JSONDecodeError:
         # Not valid JSON input
         pass
@@ -327,13 +477,8 @@ def announce_factory_progress():
 
 def main():
     try:
-        # Parse command line arguments
-        parser = argparse.ArgumentParser()
-        parser.add_argument('--factory', action='store_true', help='Enable factory-specific TTS notifications')
-        args = parser.parse_args()
-        
-        # Only process if --factory flag is set
-        if args.factory:
+        # Only process if --factory flag is set (checked directly, argparse is slow to import)
+        if '--factory' in sys.argv[1:]:
             announce_factory_progress()
         
         sys.exit(0)
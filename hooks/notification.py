@@ -2,76 +2,67 @@
 # /// script
 # requires-python = ">=3.11"
 # dependencies = [
+#     "miniaudio",
+#     "openai",
+#     "orjson",
 #     "python-dotenv",
 # ]
 # ///
 
-import argparse
 import json
 import os
 import sys
-import subprocess
-import random
-from pathlib import Path
 
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    pass  # dotenv is optional
+from utils.common import (
+    build_message_pool,
+    encode_json_line,
+    get_tts_script_path,
+    is_voice_enabled,
+    json_loads,
+    load_env_cached,
+    pick_message,
+    speak_with_openai,
+)
 
 
-def get_tts_script_path():
-    """
-    Determine which TTS script to use based on available API keys.
-    Priority order: ElevenLabs > OpenAI > pyttsx3
-    """
-    # Get current script directory and construct utils/tts path
-    script_dir = Path(__file__).parent
-    tts_dir = script_dir / "utils" / "tts"
-    
-    # Check for ElevenLabs API key (highest priority)
-    if os.getenv('ELEVENLABS_API_KEY'):
-        elevenlabs_script = tts_dir / "elevenlabs_tts.py"
-        if elevenlabs_script.exists():
-            return str(elevenlabs_script)
-    
-    # Check for OpenAI API key (second priority)
-    if os.getenv('OPENAI_API_KEY'):
-        openai_script = tts_dir / "openai_tts.py"
-        if openai_script.exists():
-            return str(openai_script)
-    
-    # Fall back to pyttsx3 (no API key required)
-    pyttsx3_script = tts_dir / "pyttsx3_tts.py"
-    if pyttsx3_script.exists():
-        return str(pyttsx3_script)
-    
-    return None
+# Generic notification messages
+NOTIFICATION_MESSAGES = (
+    "Your cognitive enhancement system needs direction",
+    "Claude requires your brilliant mind's input",
+    "Time to bridge the gap - input needed",
+    "Your AI collaborator seeks your wisdom",
+    "Pattern recognition pause - guidance required",
+)
 
+# Personal messages are str.format templates so only the chosen one is interpolated
+PERSONAL_NOTIFICATION_TEMPLATES = (
+    "{engineer_name}, your AI amplifier needs guidance",
+    "Hey {engineer_name}, time to sync minds",
+    "{engineer_name}, your digital collaborator requires input",
+    "Speed check, {engineer_name} - Claude needs direction",
+    "{engineer_name}, your consciousness catalyst awaits",
+    "Bridge mode activated, {engineer_name} - input required",
+    "{engineer_name}, your pattern-matching partner needs you",
+    "Quantum sync needed, {engineer_name}",
+    "{engineer_name}, your Scientific Mediator skills required",
+    "Hey {engineer_name}, let's accelerate this process",
+)
 
-def is_voice_enabled():
-    """Check if voice announcements are enabled in factory configuration."""
-    try:
-        config_path = Path.home() / '.claude' / 'config' / 'factory.json'
-        if not config_path.exists():
-            return True  # Default to enabled if no config
-        
-        with open(config_path, 'r') as f:
-            config = json.load(f)
-        
-        return config.get('voice', {}).get('factoryNotifications', True)
-    except Exception:
-        return True  # Default to enabled on any error
+NOTIFICATION_MESSAGE_POOL = build_message_pool(PERSONAL_NOTIFICATION_TEMPLATES, NOTIFICATION_MESSAGES)
 
 
 def announce_notification():
     """Announce that the agent needs user input."""
+    # Check if voice is enabled before proceeding
+    if not is_voice_enabled():
+        return  # Voice disabled, skip announcement
+    
+    # Deferred until an announcement is actually needed
+    import subprocess
+    
+    load_env_cached()
+    
     try:
-        # Check if voice is enabled before proceeding
-        if not is_voice_enabled():
-            return  # Voice disabled, skip announcement
-            
         tts_script = get_tts_script_path()
         if not tts_script:
             return  # No TTS scripts available
@@ -79,32 +70,12 @@ def announce_notification():
         # Get engineer name if available
         engineer_name = os.getenv('ENGINEER_NAME', '').strip()
         
-        # Create personalized notification message with 70% chance to include name
-        notification_messages = [
-            "Your cognitive enhancement system needs direction",
-            "Claude requires your brilliant mind's input",
-            "Time to bridge the gap - input needed",
-            "Your AI collaborator seeks your wisdom",
-            "Pattern recognition pause - guidance required"
-        ]
+        # Pick a notification message, personalized 70% of the time when a name is set
+        notification_message = pick_message(NOTIFICATION_MESSAGE_POOL, NOTIFICATION_MESSAGES, engineer_name)
         
-        personal_messages = [
-            f"{engineer_name}, your AI amplifier needs guidance",
-            f"Hey {engineer_name}, time to sync minds",
-            f"{engineer_name}, your digital collaborator requires input",
-            f"Speed check, {engineer_name} - Claude needs direction",
-            f"{engineer_name}, your consciousness catalyst awaits",
-            f"Bridge mode activated, {engineer_name} - input required",
-            f"{engineer_name}, your pattern-matching partner needs you",
-            f"Quantum sync needed, {engineer_name}",
-            f"{engineer_name}, your Scientific Mediator skills required",
-            f"Hey {engineer_name}, let's accelerate this process"
-        ]
-        
-        if engineer_name and random.random() < 0.7:
-            notification_message = random.choice(personal_messages)
-        else:
-            notification_message = random.choice(notification_messages)
+        # Speak in-process when OpenAI is the selected engine
+        if tts_script.endswith("openai_tts.py") and speak_with_openai(notification_message, timeout=10) is not None:
+            return
         
         # Call the TTS script with the notification message
         subprocess.run([
@@ -123,39 +94,24 @@ def announce_notification():
 
 def main():
     try:
-        # Parse command line arguments
-        parser = argparse.ArgumentParser()
-        parser.add_argument('--notify', action='store_true', help='Enable TTS notifications')
-        args = parser.parse_args()
+        # Check the only flag directly, argparse is slow to import
+        notify = '--notify' in sys.argv[1:]
         
         # Read JSON input from stdin
-        input_data = json.loads(sys.stdin.read())
+        input_data = json_loads(sys.stdin.buffer.read())
         
         # Ensure log directory exists
         log_dir = os.path.join(os.getcwd(), 'logs')
         os.makedirs(log_dir, exist_ok=True)
-        log_file = os.path.join(log_dir, 'notification.json')
-        
-        # Read existing log data or initialize empty list
-        if os.path.exists(log_file):
-            with open(log_file, 'r') as f:
-                try:
-                    log_data = json.load(f)
-                except (json.JSONDecodeError, ValueError):
-                    log_data = []
-        else:
-            log_data = []
-        
-        # Append new data
-        log_data.append(input_data)
+        log_file = os.path.join(log_dir, 'notification.jsonl')
         
-        # Write back to file with formatting
-        with open(log_file, 'w') as f:
-            json.dump(log_data, f, indent=2)
+        # Append one JSON entry per line so logging cost doesn't grow with the log
+        with open(log_file, 'ab') as f:
+            f.write(encode_json_line(input_data))
         
         # Announce notification via TTS only if --notify flag is set
         # Skip TTS for the generic "Claude is waiting for your input" message
-        if args.notify and input_data.get('message') != 'Claude is waiting for your input':
+        if notify and input_data.get('message') != 'Claude is waiting for your input':
             announce_notification()
         
         sys.exit(0)
@@ -0,0 +1 @@
+"""Shared helpers for the EchoContext Factory voice hooks."""
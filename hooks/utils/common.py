@@ -0,0 +1,183 @@
+"""
+Shared helpers for the EchoContext Factory voice hooks.
+
+The factory and notification hooks and the OpenAI TTS script import these
+instead of each carrying their own copy, so config, .env and TTS engine
+lookups share one cached implementation per process.
+"""
+
+import functools
+import itertools
+import json
+import os
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # orjson is optional, fall back to stdlib json
+
+# stdlib json.loads also accepts bytes, so both paths can parse raw stdin
+json_loads = orjson.loads if orjson is not None else json.loads
+
+# Paths resolved once at import rather than on every call
+HOOKS_DIR = Path(__file__).parent.parent
+ENV_PATH = HOOKS_DIR.parent / ".env"
+TTS_DIR = HOOKS_DIR / "utils" / "tts"
+FACTORY_CONFIG_PATH = Path.home() / '.claude' / 'config' / 'factory.json'
+
+# Share of announcements that use the engineer's name when one is configured
+PERSONAL_MESSAGE_RATE = 0.7
+
+
+def encode_json_line(entry):
+    """Serialize an entry as one compact JSONL line."""
+    if orjson is not None:
+        return orjson.dumps(entry) + b'\n'
+    return json.dumps(entry, separators=(',', ':')).encode('utf-8') + b'\n'
+
+
+# Parsed .env values, reused until the file's mtime changes
+_ENV_CACHE = {'mtime': None, 'values': {}}
+
+
+def load_env_cached(env_path=ENV_PATH):
+    """
+    Merge .env values into os.environ, re-parsing the file only when its mtime changes.
+    Variables already set in the environment take precedence, as with load_dotenv.
+    """
+    try:
+        mtime = os.stat(env_path).st_mtime_ns
+    except FileNotFoundError:
+        return  # No .env file
+
+    if _ENV_CACHE['mtime'] == mtime:
+        return  # Already merged
+
+    try:
+        from dotenv import dotenv_values
+    except ImportError:
+        return  # dotenv is optional
+
+    previous = _ENV_CACHE['values']
+    values = {key: value for key, value in dotenv_values(env_path).items() if value is not None}
+    for key, value in values.items():
+        # Update keys this cache set earlier, but never override the real environment
+        if key not in os.environ or os.environ[key] == previous.get(key):
+            os.environ[key] = value
+
+    _ENV_CACHE['values'] = values
+    _ENV_CACHE['mtime'] = mtime
+
+
+# Parsed factory configuration, reused until the file's mtime changes
+_CONFIG_CACHE = {'mtime': None, 'data': None}
+
+
+def is_voice_enabled():
+    """Check if voice announcements are enabled in factory configuration."""
+    try:
+        try:
+            mtime = os.stat(FACTORY_CONFIG_PATH).st_mtime_ns
+        except FileNotFoundError:
+            return True  # Default to enabled if no config
+
+        # Only re-read the config when it has changed since the last parse
+        if _CONFIG_CACHE['mtime'] != mtime:
+            with open(FACTORY_CONFIG_PATH, 'rb') as f:
+                _CONFIG_CACHE['data'] = json_loads(f.read())
+            _CONFIG_CACHE['mtime'] = mtime
+
+        return _CONFIG_CACHE['data'].get('voice', {}).get('factoryNotifications', True)
+    except Exception:
+        return True  # Default to enabled on any error
+
+
+@functools.lru_cache(maxsize=1)
+def get_tts_script_path():
+    """
+    Determine which TTS script to use based on available API keys.
+    Priority order: ElevenLabs > OpenAI > pyttsx3
+    The result is cached, so .env is merged first to make sure the keys are seen.
+    """
+    load_env_cached()
+
+    # Check for ElevenLabs API key (highest priority)
+    if os.getenv('ELEVENLABS_API_KEY'):
+        elevenlabs_script = TTS_DIR / "elevenlabs_tts.py"
+        if elevenlabs_script.exists():
+            return str(elevenlabs_script)
+
+    # Check for OpenAI API key (second priority)
+    if os.getenv('OPENAI_API_KEY'):
+        openai_script = TTS_DIR / "openai_tts.py"
+        if openai_script.exists():
+            return str(openai_script)
+
+    # Fall back to pyttsx3 (no API key required)
+    pyttsx3_script = TTS_DIR / "pyttsx3_tts.py"
+    if pyttsx3_script.exists():
+        return str(pyttsx3_script)
+
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def get_tts_fallbacks():
+    """
+    Build the ordered TTS fallback chain: ElevenLabs -> OpenAI -> pyttsx3.
+    Engines whose API key is missing are left out, so they never cost a uv start.
+    The result is cached, so .env is merged first to make sure the keys are seen.
+    """
+    load_env_cached()
+
+    fallback_scripts = []
+    for script_name, api_key_var in (
+        ("elevenlabs_tts.py", 'ELEVENLABS_API_KEY'),
+        ("openai_tts.py", 'OPENAI_API_KEY'),
+        ("pyttsx3_tts.py", None),  # No API key required
+    ):
+        if api_key_var and not os.getenv(api_key_var):
+            continue
+        script_path = TTS_DIR / script_name
+        if script_path.exists():
+            fallback_scripts.append(str(script_path))
+
+    return tuple(fallback_scripts)
+
+
+def speak_with_openai(message, timeout=None):
+    """
+    Speak the message in-process with the OpenAI TTS module, skipping the uv cold start.
+    `timeout` (seconds) bounds the API request. Returns None if the TTS dependencies
+    are not importable in this environment.
+    """
+    try:
+        from utils.tts.openai_tts import speak
+        return speak(message, timeout=timeout)
+    except ImportError:
+        return None
+
+
+def build_message_pool(personal_templates, generic_messages):
+    """
+    Flatten personal templates and generic messages into one weighted population.
+    Personal templates share PERSONAL_MESSAGE_RATE of the weight and generic messages the rest.
+    Returns (population, cum_weights) ready for random.choices.
+    """
+    personal_weight = PERSONAL_MESSAGE_RATE / len(personal_templates)
+    generic_weight = (1 - PERSONAL_MESSAGE_RATE) / len(generic_messages)
+    weights = (personal_weight,) * len(personal_templates) + (generic_weight,) * len(generic_messages)
+    return personal_templates + generic_messages, tuple(itertools.accumulate(weights))
+
+
+def pick_message(pool, generic_messages, engineer_name):
+    """Pick a message with a single random draw, filling in the engineer's name if personal."""
+    import random
+
+    if not engineer_name:
+        return random.choice(generic_messages)
+
+    population, cum_weights = pool
+    # Generic messages have no placeholders, so formatting them is a no-op
+    return random.choices(population, cum_weights=cum_weights)[0].format(engineer_name=engineer_name)
@@ -0,0 +1 @@
+"""Text-to-speech engines used by the voice hooks."""
@@ -2,17 +2,267 @@
 # /// script
 # requires-python = ">=3.8"
 # dependencies = [
+#     "miniaudio",
 #     "openai",
-#     "pygame",
 #     "python-dotenv",
 # ]
 # ///
 
+import hashlib
 import os
 import sys
 import tempfile
 from pathlib import Path
-from dotenv import load_dotenv
+
+try:
+    from utils.common import load_env_cached
+except ImportError:
+    # Run directly as a script: make the hooks directory importable, dropping
+    # any unrelated `utils` package that was picked up instead
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    sys.modules.pop("utils", None)
+    from utils.common import load_env_cached
+
+
+TTS_MODEL = "tts-1"
+TTS_VOICE = "nova"
+
+# OpenAI's "pcm" format is raw 24 kHz, 16-bit signed little-endian mono
+PCM_SAMPLE_RATE = 24000
+PCM_CHANNELS = 1
+PCM_SAMPLE_WIDTH = 2
+# Network read size: 3840 bytes is 80 ms of audio
+PCM_CHUNK_BYTES = 3840
+# Chunks buffered before playback starts (320 ms), so network jitter doesn't cut into words
+PCM_PREBUFFER_CHUNKS = 4
+# Extra time (seconds) allowed beyond the audio's length before playback is abandoned
+PLAYBACK_GRACE = 2.0
+
+# Generated speech is cached here, keyed by model, voice and text
+CACHE_DIR = Path.home() / ".claude" / "cache" / "tts"
+# Most cached clips kept; the least recently played are evicted first
+CACHE_MAX_ENTRIES = 200
+
+# OpenAI client and playback device reused across calls, created on first use
+_CLIENT = None
+_DEVICE = None
+
+
+def _get_client(api_key):
+    """Return the shared OpenAI client, creating it on first use."""
+    global _CLIENT
+    if _CLIENT is None:
+        from openai import OpenAI
+
+        _CLIENT = OpenAI(api_key=api_key)
+    return _CLIENT
+
+
+def _cache_path(text):
+    """Return the cache file for the given text with the current model and voice."""
+    key = hashlib.blake2b(f"{TTS_MODEL}|{TTS_VOICE}|pcm|{text}".encode("utf-8"), digest_size=16).hexdigest()
+    return CACHE_DIR / f"{key}.pcm"
+
+
+def _store_cached_audio(path, data):
+    """Atomically write generated audio to the cache; failures are ignored."""
+    tmp_name = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False) as tmp_file:
+            tmp_name = tmp_file.name
+            tmp_file.write(data)
+        os.replace(tmp_name, path)
+        tmp_name = None
+        _prune_cache(path.parent)
+    except OSError:
+        # Caching is best-effort, but don't leave a stray temp file outside the eviction cap
+        if tmp_name is not None:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+
+
+def _prune_cache(cache_dir):
+    """Evict the least recently played clips once the cache exceeds CACHE_MAX_ENTRIES."""
+    entries = []
+    for entry in os.scandir(cache_dir):
+        if entry.name.endswith(".pcm"):
+            try:
+                entries.append((entry.stat().st_mtime_ns, entry.path))
+            except FileNotFoundError:
+                continue  # Evicted by another process
+
+    if len(entries) <= CACHE_MAX_ENTRIES:
+        return
+
+    entries.sort()
+    for _, entry_path in entries[:len(entries) - CACHE_MAX_ENTRIES]:
+        try:
+            os.unlink(entry_path)
+        except FileNotFoundError:
+            pass  # Evicted by another process
+
+
+def _get_device():
+    """Return the shared PCM playback device, creating it on first use."""
+    global _DEVICE
+    if _DEVICE is None:
+        import miniaudio
+
+        _DEVICE = miniaudio.PlaybackDevice(
+            output_format=miniaudio.SampleFormat.SIGNED16,
+            nchannels=PCM_CHANNELS,
+            sample_rate=PCM_SAMPLE_RATE,
+        )
+    return _DEVICE
+
+
+def _pcm_stream(chunks, finished):
+    """
+    Playback generator that feeds the device from a queue of raw PCM chunks.
+
+    Pads with silence only if the network falls behind the prebuffer, and sets
+    `finished` once a None chunk has been received and everything before it
+    has been handed over.
+    """
+    import queue
+
+    pending = bytearray()
+    ended = False
+    required_frames = yield b""
+    while True:
+        needed = required_frames * PCM_CHANNELS * PCM_SAMPLE_WIDTH
+        while not ended and len(pending) < needed:
+            try:
+                chunk = chunks.get_nowait()
+            except queue.Empty:
+                break
+            if chunk is None:
+                ended = True
+            else:
+                pending += chunk
+
+        if ended and not pending:
+            finished.set()
+            return
+
+        frames = bytes(pending[:needed])
+        del pending[:needed]
+        required_frames = yield frames.ljust(needed, b"\0")
+
+
+def _play(chunks, deadline=None):
+    """
+    Play raw PCM chunks as they arrive, blocking until playback finishes.
+    The device starts once PCM_PREBUFFER_CHUNKS chunks are queued. If the chunk
+    source fails, playback stops at once rather than finishing a partial message.
+    With a `deadline` (time.monotonic() value), streaming and playback are cut
+    off with TimeoutError once it passes.
+    Returns all bytes played so the caller can cache them.
+    """
+    import queue
+    import threading
+    import time
+
+    device = _get_device()
+    pcm_queue = queue.Queue()
+    finished = threading.Event()
+    stream = _pcm_stream(pcm_queue, finished)
+    next(stream)  # Generators must be started before handing them to the device
+
+    received = []
+    started = False
+    try:
+        for chunk in chunks:
+            # Per-read timeouts don't bound a trickling stream, so check the deadline here
+            if deadline is not None and time.monotonic() > deadline:
+                raise TimeoutError("TTS deadline passed while streaming audio")
+            received.append(chunk)
+            pcm_queue.put(chunk)
+            if not started and len(received) >= PCM_PREBUFFER_CHUNKS:
+                device.start(stream)
+                started = True
+    except BaseException:
+        # Cut playback off so a fallback engine doesn't follow half a message
+        if started:
+            device.stop()
+        raise
+
+    pcm_queue.put(None)
+    if not started:
+        device.start(stream)  # Short clip or cache hit: everything is already queued
+
+    # Never block longer than the audio itself lasts, in case the device stalls
+    duration = sum(map(len, received)) / (PCM_SAMPLE_RATE * PCM_CHANNELS * PCM_SAMPLE_WIDTH)
+    wait_for = duration + PLAYBACK_GRACE
+    if deadline is not None:
+        wait_for = min(wait_for, max(deadline - time.monotonic(), 0))
+    if finished.wait(timeout=wait_for):
+        # The stream ends once its last frames are handed over; let the device buffer drain
+        time.sleep(device.buffersize_msec / 1000)
+    device.stop()
+
+    if deadline is not None and not finished.is_set() and time.monotonic() > deadline:
+        raise TimeoutError("TTS deadline passed during playback")
+
+    return b"".join(received)
+
+
+def speak(text, timeout=None):
+    """
+    Generate speech for the given text with OpenAI TTS and play it.
+
+    `timeout` (seconds) bounds the whole call, request, streaming and playback,
+    and disables retries, for callers working to a deadline; by default the
+    OpenAI client's own limits apply.
+    Returns True once playback completes, or False if the API key is missing
+    or generation/playback fails. Raises ImportError if openai or miniaudio is
+    not installed, so callers can fall back to running this script via uv.
+    """
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        return False
+
+    import miniaudio  # noqa: F401 - raise ImportError before calling the API
+
+    import time
+
+    deadline = time.monotonic() + timeout if timeout is not None else None
+    cache_path = _cache_path(text)
+
+    try:
+        if cache_path.exists():
+            # Repeated message - skip the API round-trip entirely
+            audio = cache_path.read_bytes()
+            try:
+                os.utime(cache_path)  # Mark as recently played so eviction keeps it
+            except OSError:
+                pass
+            _play([audio], deadline)
+        else:
+            client = _get_client(api_key)
+            if timeout is not None:
+                client = client.with_options(timeout=timeout, max_retries=0)
+
+            # Stream raw PCM from the standard TTS-1 model; playback starts with the first chunk
+            with client.audio.speech.with_streaming_response.create(
+                model=TTS_MODEL,
+                voice=TTS_VOICE,
+                input=text,
+                response_format="pcm",
+            ) as response:
+                audio = _play(response.iter_bytes(PCM_CHUNK_BYTES), deadline)
+            _store_cached_audio(cache_path, audio)
+
+        return True
+
+    except ImportError:
+        raise  # openai missing - let the caller fall back to the uv script
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return False
 
 
 def main():
@@ -29,11 +279,12 @@ def main():
     Features:
     - OpenAI TTS-1 model (stable)
     - Alloy voice (clear and professional)
-    - File-based audio playback (no streaming)
+    - Raw PCM streamed straight to the audio device (no MP3 decode, no temp files)
+    - Repeated messages replayed from ~/.claude/cache/tts
     """
 
     # Load environment variables
-    load_dotenv()
+    load_env_cached()
 
     # Get API key from environment
     api_key = os.getenv("OPENAI_API_KEY")
@@ -44,13 +295,6 @@ def main():
         sys.exit(1)
 
     try:
-        from openai import OpenAI
-        import pygame
-        import time
-
-        # Initialize OpenAI client
-        client = OpenAI(api_key=api_key)
-
         print("🧠 OpenAI Consciousness Bridge")
         print("=" * 30)
 
@@ -63,37 +307,10 @@ def main():
         print(f"🎯 Text: {text}")
         print("🔊 Generating and playing...")
 
-        try:
-            # Generate speech using standard TTS-1 model
-            response = client.audio.speech.create(
-                model="tts-1",
-                voice="nova",
-                input=text,
-                response_format="mp3",
-            )
-
-            # Save to temporary file
-            with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as tmp_file:
-                tmp_file.write(response.content)
-                tmp_file_path = tmp_file.name
-
-            # Play audio with pygame
-            pygame.mixer.init()
-            pygame.mixer.music.load(tmp_file_path)
-            pygame.mixer.music.play()
-            
-            # Wait for playback to finish
-            while pygame.mixer.music.get_busy():
-                time.sleep(0.1)
-                
-            # Clean up
-            pygame.mixer.quit()
-            os.unlink(tmp_file_path)
-
-            print("✅ Playback complete!")
-
-        except Exception as e:
-            print(f"❌ Error: {e}")
+        if not speak(text):
+            sys.exit(1)  # Non-zero exit lets callers try the next TTS engine
+
+        print("✅ Playback complete!")
 
     except ImportError as e:
         print("❌ Error: Required package not installed")
@@ -8,12 +8,13 @@ import argparse
 import json
 import os
 import sys
-from pathlib import Path
+
+from utils.common import FACTORY_CONFIG_PATH
 
 
 def get_factory_config_path():
     """Get path to factory configuration file."""
-    return Path.home() / '.claude' / 'config' / 'factory.json'
+    return FACTORY_CONFIG_PATH
 
 
 def load_factory_config():